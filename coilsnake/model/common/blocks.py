@@ -45,7 +45,7 @@ class Block(object):
         pass
 
     def reset(self, size=0):
-        self.data = array.array('B', [0] * size)
+        self.data = array.array('B', bytes(size))
         self.size = size
 
     def from_file(self, filename):
@@ -53,7 +53,6 @@ class Block(object):
 
         try:
             self.size = int(os.path.getsize(filename))
-            del self.data
             self.data = array.array('B')
             with open(filename, 'rb') as file:
                 self.data.fromfile(file, self.size)
@@ -62,13 +61,11 @@ class Block(object):
 
     def from_list(self, data_list):
         self.size = len(data_list)
-        del self.data
         self.data = array.array('B')
         self.data.fromlist(data_list)
 
     def from_array(self, data_array):
         self.size = len(data_array)
-        del self.data
         self.data = copy.copy(data_array)
 
     def from_block(self, block, offset=0, size=None):
@@ -100,12 +97,16 @@ class Block(object):
             raise OutOfBoundsError("Attempted to read size[%d] bytes from offset[%#x], which is out of bounds in this "
                                    "block of size[%#x]" % (size, key, self.size))
         else:
-            out = 0
-            bit_offset = 0
-            for byte in self.data[key:key + size]:
-                out |= byte << bit_offset
-                bit_offset += 8
-            return out
+            return int.from_bytes(self.data[key:key + size], "little")
+
+    def read_bytes(self, key, size):
+        if size < 0:
+            raise InvalidArgumentError("Attempted to read data of negative length[%d]" % size)
+        elif (key < 0) or (key + size > self.size):
+            raise OutOfBoundsError("Attempted to read size[%d] bytes from offset[%#x], which is out of bounds in this "
+                                   "block of size[%#x]" % (size, key, self.size))
+        else:
+            return self.data[key:key + size].tobytes()
 
     def write_multi(self, key, item, size):
         if size < 0:
@@ -5,7 +5,7 @@ from coilsnake.exceptions.common.exceptions import InvalidArgumentError, IndexOu
     TableEntryInvalidYmlRepresentationError, TableError, TableEntryMissingDataError, TableEntryError, TableSchemaError
 from coilsnake.util.common.helper import getitem_with_default, not_in_inclusive_range
 from coilsnake.util.common.type import GenericEnum
-from coilsnake.util.common.yml import convert_values_to_hex_repr, yml_load, yml_dump
+from coilsnake.util.common.yml import convert_values_to_hex_ints, yml_load, yml_dump
 
 log = logging.getLogger(__name__)
 
@@ -463,14 +463,14 @@ class Table(object):
         self.from_yml_rep(yml_rep)
 
     def to_yml_file(self, f, default_flow_style=False):
-        yml_str_rep = yml_dump(self.to_yml_rep(), default_flow_style=default_flow_style)
+        yml_rep = self.to_yml_rep()
 
-        # Rewrite hexints in hexidecimal
-        # The YAML parser does not offer this option, so this has to be done with a regex
-        for hex_label in self.schema.yml_rep_hex_labels():
-            yml_str_rep = convert_values_to_hex_repr(yml_str_rep, hex_label)
+        # Write hexints in hexidecimal
+        hex_labels = self.schema.yml_rep_hex_labels()
+        if hex_labels:
+            yml_rep = convert_values_to_hex_ints(yml_rep, hex_labels)
 
-        f.write(yml_str_rep)
+        yml_dump(yml_rep, f, default_flow_style=default_flow_style)
 
     def __getitem__(self, index):
         row = index
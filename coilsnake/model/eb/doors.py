@@ -52,11 +52,14 @@ class GenericDoor(EqualityMixin, StringRepresentationMixin):
         return 5
 
     def write_destination_to_block(self, block, offset, destination_block, destination_locations):
-        if destination_block in destination_locations:
-            block.write_multi(offset + 3, destination_locations[destination_block], 2)
+        # Doors often share destinations, so each distinct destination is only allocated once. Destinations are keyed
+        # by their raw bytes, which hash and compare faster than Blocks.
+        destination_key = destination_block.data.tobytes()
+        if destination_key in destination_locations:
+            block.write_multi(offset + 3, destination_locations[destination_key], 2)
         else:
             destination_offset = block.allocate(data=destination_block, can_write_to=in_destination_bank)
-            destination_locations[destination_block] = destination_offset & 0xffff
+            destination_locations[destination_key] = destination_offset & 0xffff
             block.write_multi(offset + 3, destination_offset, 2)
 
     def yml_rep(self):
@@ -299,12 +302,13 @@ DOOR_TYPE_ID_TO_CLASS_MAP = [
 
 
 def door_from_block(block, offset):
+    door_type = block[offset + 2]
     try:
-        door = DOOR_TYPE_ID_TO_CLASS_MAP[block[offset + 2]]()
+        door = DOOR_TYPE_ID_TO_CLASS_MAP[door_type]()
         door.from_block(block, offset)
         return door
     except IndexError:
-        log.debug("Ignoring a door at {:#x} with an invalid type of {:#x}".format(offset, block[offset + 2]))
+        log.debug("Ignoring a door at {:#x} with an invalid type of {:#x}".format(offset, door_type))
         return None
     except InvalidUserDataError as e:
         log.debug("Ignoring a door at {:#x} that contained invalid data: {}".format(offset, e.message))
@@ -1,5 +1,6 @@
 from array import array
 from copy import deepcopy
+from zlib import crc32
 
 from PIL import Image
 
@@ -206,6 +207,14 @@ class EbGraphicTileset(EqualityMixin):
                 and (self.tile_height == other.tile_height)
                 and (self.tiles == other.tiles))
 
+    def hash(self):
+        """Returns a checksum of this tileset's tiles. Equal tilesets have equal checksums."""
+        csum = 0
+        for tile in self.tiles:
+            for row in tile:
+                csum = crc32(bytes(row), csum)
+        return csum
+
     def __getitem__(self, key):
         return self.tiles[key]
 
@@ -275,28 +284,37 @@ class EbTileArrangement(EqualityMixin):
     def block_size(self):
         return 2 * sum([len(x) for x in self.arrangement])
 
+    def hash(self):
+        """Returns a hash of this arrangement's items. Equal arrangements have equal hashes."""
+        return hash(tuple((item.tile, item.subpalette, item.is_vertically_flipped, item.is_horizontally_flipped,
+                           item.is_priority)
+                          for row in self.arrangement for item in row))
+
     def to_image(self, image, tileset, palette, ignore_subpalettes=False):
         palette.to_image(image)
-        image_data = image.load()
-        offset_y = 0
+
+        # Build the image's pixel data a whole tile row at a time and paste it in at once, rather than setting each
+        # pixel individually
+        data = bytearray()
         for row in self.arrangement:
-            offset_x = 0
+            row_tiles = []
             for item in row:
-                tile = tileset[item.tile]
-                if ignore_subpalettes:
-                    palette_offset = 0
-                else:
-                    palette_offset = item.subpalette*palette.subpalette_length
-                for tile_y in range(tileset.tile_height):
-                    for tile_x in range(tileset.tile_width):
-                        pixel_x, pixel_y = tile_x, tile_y
-                        if item.is_vertically_flipped:
-                            pixel_y = tileset.tile_height - pixel_y - 1
-                        if item.is_horizontally_flipped:
-                            pixel_x = tileset.tile_width - pixel_x - 1
-                        image_data[offset_x + tile_x, offset_y + tile_y] = tile[pixel_y][pixel_x] + palette_offset
-                offset_x += tileset.tile_width
-            offset_y += tileset.tile_height
+                tile = [bytes(tile_row) for tile_row in tileset[item.tile]]
+                if item.is_vertically_flipped:
+                    tile.reverse()
+                if item.is_horizontally_flipped:
+                    tile = [tile_row[::-1] for tile_row in tile]
+                if not ignore_subpalettes and item.subpalette:
+                    palette_offset = item.subpalette * palette.subpalette_length
+                    tile = [bytes(x + palette_offset for x in tile_row) for tile_row in tile]
+                row_tiles.append(tile)
+
+            for tile_y in range(tileset.tile_height):
+                data += b"".join([tile[tile_y] for tile in row_tiles])
+
+        image.paste(Image.frombytes("P", (self.width * tileset.tile_width, self.height * tileset.tile_height),
+                                    bytes(data)),
+                    (0, 0))
 
     def image(self, tileset, palette, ignore_subpalettes=False):
         image = Image.new("P", (self.width * tileset.tile_width,
@@ -357,20 +375,20 @@ class EbTileArrangement(EqualityMixin):
     def _from_image_with_single_subpalette(self, image, tileset, palette, no_flip=False, dedup=True, is_animation=False):
         # Don't need to do any subpalette fitting because there's only one subpalette
         palette.from_image(image)
-        image_data = image.load()
 
-        tile = [array('B', [0] * tileset.tile_width) for i in range(tileset.tile_height)]
+        # Slice each tile's rows out of the image's raw pixel data rather than reading each pixel individually
+        image_data = image.tobytes()
+        image_width = image.size[0]
 
         for arrangement_y in range(self.height):
             image_y = arrangement_y * tileset.tile_height
             for arrangement_x in range(self.width):
                 image_x = arrangement_x * tileset.tile_width
 
+                tile = []
                 for tile_y in range(tileset.tile_height):
-                    image_tile_y = image_y + tile_y
-                    tile_row = tile[tile_y]
-                    for tile_x in range(tileset.tile_width):
-                        tile_row[tile_x] = image_data[image_x + tile_x, image_tile_y]
+                    offset = (image_y + tile_y) * image_width + image_x
+                    tile.append(array('B', image_data[offset:offset + tileset.tile_width]))
 
                 tile_id, vflip, hflip = tileset.add_tile(tile, no_flip, dedup)
                 arrangement_item = self.arrangement[arrangement_y][arrangement_x]
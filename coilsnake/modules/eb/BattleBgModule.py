@@ -7,7 +7,7 @@ from coilsnake.model.eb.palettes import EbPalette
 from coilsnake.model.eb.table import eb_table_from_offset
 from coilsnake.modules.eb.EbModule import EbModule
 from coilsnake.util.common.image import open_indexed_image
-from coilsnake.util.eb.pointer import from_snes_address, read_asm_pointer, to_snes_address, write_asm_pointer
+from coilsnake.util.eb.pointer import from_snes_address, read_asm_pointer, to_snes_address, write_asm_pointers
 
 
 log = logging.getLogger(__name__)
@@ -69,28 +69,26 @@ class BattleBgModule(EbModule):
 
         self.backgrounds = [None for i in range(self.graphics_pointer_table.num_rows)]
         self.palettes = [None for i in range(self.palette_pointer_table.num_rows)]
-        for i in range(self.bg_table.num_rows):
-            graphics_id = self.bg_table[i][0]
-            color_depth = self.bg_table[i][2]
+        # Decompressing replaces the block's data, so one block can be reused for every tileset and arrangement
+        compressed_block = EbCompressibleBlock()
+        for row in self.bg_table.values:
+            graphics_id, palette_id, color_depth = row[0], row[1], row[2]
             if self.backgrounds[graphics_id] is None:
                 # Max tiles used in rom: 421 (2bpp) 442 (4bpp)
                 tileset = EbGraphicTileset(num_tiles=512, tile_width=8, tile_height=8)
-                with EbCompressibleBlock() as compressed_block:
-                    compressed_block.from_compressed_block(
-                        block=rom,
-                        offset=from_snes_address(self.graphics_pointer_table[graphics_id][0]))
-                    tileset.from_block(compressed_block, offset=0, bpp=color_depth)
+                compressed_block.from_compressed_block(
+                    block=rom,
+                    offset=from_snes_address(self.graphics_pointer_table[graphics_id][0]))
+                tileset.from_block(compressed_block, offset=0, bpp=color_depth)
 
                 arrangement = EbTileArrangement(width=32, height=32)
-                with EbCompressibleBlock() as compressed_block:
-                    compressed_block.from_compressed_block(
-                        block=rom,
-                        offset=from_snes_address(self.arrangement_pointer_table[graphics_id][0]))
-                    arrangement.from_block(block=compressed_block, offset=0)
+                compressed_block.from_compressed_block(
+                    block=rom,
+                    offset=from_snes_address(self.arrangement_pointer_table[graphics_id][0]))
+                arrangement.from_block(block=compressed_block, offset=0)
 
                 self.backgrounds[graphics_id] = (tileset, color_depth, arrangement)
-                
-            palette_id = self.bg_table[i][1]
+
             if self.palettes[palette_id] is None:
                 palette = EbPalette(num_subpalettes=1, subpalette_length=16)
                 palette.from_block(block=rom, offset=from_snes_address(self.palette_pointer_table[palette_id][0]))
@@ -105,11 +103,11 @@ class BattleBgModule(EbModule):
             self.distortion_table.to_yml_file(f)
 
         # Export BGs by table entry
-        for i in range(self.bg_table.num_rows):
-            tileset, color_depth, arrangement = self.backgrounds[self.bg_table[i][0]]
-            palette = self.palettes[self.bg_table[i][1]]
+        for i, row in enumerate(self.bg_table.values):
+            tileset, color_depth, arrangement = self.backgrounds[row[0]]
+            palette = self.palettes[row[1]]
 
-            with resource_open("BattleBGs/" + str(i).zfill(3), "png") as f:
+            with resource_open("BattleBGs/{:03d}".format(i), "png") as f:
                 image = arrangement.image(tileset, palette)
                 image.save(f, "png")
 
@@ -123,9 +121,13 @@ class BattleBgModule(EbModule):
 
         self.backgrounds = []
         self.palettes = []
-        for i in range(self.bg_table.num_rows):
-            new_color_depth = self.bg_table[i][2]
-            with resource_open("BattleBGs/" + str(i).zfill(3), "png") as f:
+        # Many table entries share graphics or palettes, so find duplicates by hash rather than comparing against every
+        # background and palette read so far
+        background_ids = dict()
+        palette_ids = dict()
+        for i, row in enumerate(self.bg_table.values):
+            new_color_depth = row[2]
+            with resource_open("BattleBGs/{:03d}".format(i), "png") as f:
                 image = open_indexed_image(f)
 
                 new_palette = EbPalette(num_subpalettes=1, subpalette_length=16)
@@ -134,23 +136,22 @@ class BattleBgModule(EbModule):
 
                 new_arrangement.from_image(image, new_tileset, new_palette)
 
-                for j, (tileset, color_depth, arrangement) in enumerate(self.backgrounds):
-                    if (color_depth == new_color_depth) \
-                            and (tileset == new_tileset) \
-                            and (arrangement == new_arrangement):
-                        self.bg_table[i][0] = j
-                        break
-                else:
-                    self.bg_table[i][0] = len(self.backgrounds)
-                    self.backgrounds.append((new_tileset, new_color_depth, new_arrangement))
-
-                for j, palette in enumerate(self.palettes):
-                    if palette == new_palette:
-                        self.bg_table[i][1] = j
-                        break
-                else:
-                    self.bg_table[i][1] = len(self.palettes)
+                new_background = (new_tileset, new_color_depth, new_arrangement)
+                background_hash = (new_color_depth, new_tileset.hash(), new_arrangement.hash())
+                j = background_ids.get(background_hash)
+                if (j is None) or (self.backgrounds[j] != new_background):
+                    j = len(self.backgrounds)
+                    background_ids[background_hash] = j
+                    self.backgrounds.append(new_background)
+                row[0] = j
+
+                palette_hash = new_palette.hash()
+                j = palette_ids.get(palette_hash)
+                if (j is None) or (self.palettes[j] != new_palette):
+                    j = len(self.palettes)
+                    palette_ids[palette_hash] = j
                     self.palettes.append(new_palette)
+                row[1] = j
 
     def write_to_rom(self, rom):
         # Write the data table
@@ -161,44 +162,45 @@ class BattleBgModule(EbModule):
         # Write graphics and arrangements
         self.graphics_pointer_table.recreate(num_rows=len(self.backgrounds))
         self.arrangement_pointer_table.recreate(num_rows=len(self.backgrounds))
+        # Allocating copies the block's data into the ROM, so the same block can be reset and reused for every
+        # tileset and arrangement
+        compressed_block = EbCompressibleBlock()
         for i, (tileset, color_depth, arrangement) in enumerate(self.backgrounds):
-            with EbCompressibleBlock(size=tileset.block_size(bpp=color_depth)) as compressed_block:
-                tileset.to_block(block=compressed_block, offset=0, bpp=color_depth)
-                compressed_block.compress()
-                tileset_offset = rom.allocate(data=compressed_block)
-                self.graphics_pointer_table[i] = [to_snes_address(tileset_offset)]
-
-            with EbCompressibleBlock(size=arrangement.block_size()) as compressed_block:
-                arrangement.to_block(block=compressed_block, offset=0)
-                compressed_block.compress()
-                arrangement_offset = rom.allocate(data=compressed_block)
-                self.arrangement_pointer_table[i] = [to_snes_address(arrangement_offset)]
+            compressed_block.reset(size=tileset.block_size(bpp=color_depth))
+            tileset.to_block(block=compressed_block, offset=0, bpp=color_depth)
+            compressed_block.compress()
+            tileset_offset = rom.allocate(data=compressed_block)
+            self.graphics_pointer_table[i] = [to_snes_address(tileset_offset)]
+
+            compressed_block.reset(size=arrangement.block_size())
+            arrangement.to_block(block=compressed_block, offset=0)
+            compressed_block.compress()
+            arrangement_offset = rom.allocate(data=compressed_block)
+            self.arrangement_pointer_table[i] = [to_snes_address(arrangement_offset)]
 
         graphics_pointer_table_offset = rom.allocate(size=self.graphics_pointer_table.size)
         self.graphics_pointer_table.to_block(block=rom, offset=graphics_pointer_table_offset)
-        for asm_pointer_offset in GRAPHICS_POINTER_TABLE_ASM_POINTER_OFFSETS:
-            write_asm_pointer(block=rom,
-                              offset=asm_pointer_offset,
-                              pointer=to_snes_address(graphics_pointer_table_offset))
+        write_asm_pointers(block=rom,
+                           offsets=GRAPHICS_POINTER_TABLE_ASM_POINTER_OFFSETS,
+                           pointer=to_snes_address(graphics_pointer_table_offset))
 
         arrangement_pointer_table_offset = rom.allocate(size=self.arrangement_pointer_table.size)
         self.arrangement_pointer_table.to_block(block=rom, offset=arrangement_pointer_table_offset)
-        for asm_pointer_offset in ARRANGEMENT_POINTER_TABLE_ASM_POINTER_OFFSETS:
-            write_asm_pointer(block=rom,
-                              offset=asm_pointer_offset,
-                              pointer=to_snes_address(arrangement_pointer_table_offset))
+        write_asm_pointers(block=rom,
+                           offsets=ARRANGEMENT_POINTER_TABLE_ASM_POINTER_OFFSETS,
+                           pointer=to_snes_address(arrangement_pointer_table_offset))
 
         # Write pals
         self.palette_pointer_table.recreate(num_rows=len(self.palettes))
+        # Every palette overwrites all 32 bytes of the block, so it doesn't need to be reset between palettes
+        block = Block(32)
         for i, palette in enumerate(self.palettes):
-            with Block(32) as block:
-                palette.to_block(block=block, offset=0)
-                palette_offset = rom.allocate(data=block)
-                self.palette_pointer_table[i] = [to_snes_address(palette_offset)]
+            palette.to_block(block=block, offset=0)
+            palette_offset = rom.allocate(data=block)
+            self.palette_pointer_table[i] = [to_snes_address(palette_offset)]
 
         palette_pointer_table_offset = rom.allocate(size=self.palette_pointer_table.size)
         self.palette_pointer_table.to_block(block=rom, offset=palette_pointer_table_offset)
-        for asm_pointer_offset in PALETTE_POINTER_TABLE_ASM_POINTER_OFFSETS:
-            write_asm_pointer(block=rom,
-                              offset=asm_pointer_offset,
-                              pointer=to_snes_address(palette_pointer_table_offset))
\ No newline at end of file
+        write_asm_pointers(block=rom,
+                           offsets=PALETTE_POINTER_TABLE_ASM_POINTER_OFFSETS,
+                           pointer=to_snes_address(palette_pointer_table_offset))
\ No newline at end of file
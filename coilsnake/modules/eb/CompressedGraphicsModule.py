@@ -6,7 +6,8 @@ from coilsnake.model.eb.graphics import EbTileArrangement, EbTownMap, EbCompanyL
 from coilsnake.model.eb.town_maps import TOWN_MAP_NAMES
 from coilsnake.modules.eb.EbModule import EbModule
 from coilsnake.util.common.image import open_indexed_image, open_image
-from coilsnake.util.eb.pointer import from_snes_address, to_snes_address, read_asm_pointer, write_asm_pointer
+from coilsnake.util.eb.pointer import from_snes_address, to_snes_address, read_asm_pointer, write_asm_pointer, \
+    write_asm_pointers
 
 
 log = logging.getLogger(__name__)
@@ -193,10 +194,10 @@ class CompressedGraphicsModule(EbModule):
         for info, logo in zip(infos, logos):
             graphics_offset, arrangement_offset, palette_offsets = logo.to_block(rom)
 
-            for asm_pointer_offset in info.graphics_asm_pointer_offsets:
-                write_asm_pointer(block=rom, offset=asm_pointer_offset, pointer=to_snes_address(graphics_offset))
-            for asm_pointer_offset in info.arrangement_asm_pointer_offsets:
-                write_asm_pointer(block=rom, offset=asm_pointer_offset, pointer=to_snes_address(arrangement_offset))
+            write_asm_pointers(block=rom, offsets=info.graphics_asm_pointer_offsets,
+                               pointer=to_snes_address(graphics_offset))
+            write_asm_pointers(block=rom, offsets=info.arrangement_asm_pointer_offsets,
+                               pointer=to_snes_address(arrangement_offset))
             for offset, asm_pointer_offset in zip(palette_offsets, info.palette_asm_pointer_offsets):
                 write_asm_pointer(block=rom, offset=asm_pointer_offset, pointer=to_snes_address(offset))
 
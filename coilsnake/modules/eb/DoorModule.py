@@ -1,30 +1,86 @@
-from coilsnake.model.eb.doors import door_from_block, door_from_yml_rep, not_in_destination_bank
+import array
+import re
+import struct
+
+from coilsnake.exceptions.common.exceptions import InvalidArgumentError, NotEnoughUnallocatedSpaceError, TableError
+from coilsnake.model.eb.doors import door_from_block, door_from_yml_rep, not_in_destination_bank, ClimbableType, \
+    DestinationDirection, DoorType, StairDirection
 from coilsnake.model.eb.table import eb_table_from_offset
 from coilsnake.modules.eb.EbModule import EbModule
-from coilsnake.util.common.yml import convert_values_to_hex_repr, yml_load, yml_dump
+from coilsnake.util.common.yml import yml_load
 from coilsnake.util.eb.pointer import from_snes_address, to_snes_address
 
-from collections import OrderedDict
+DOOR_POINTER_TABLE_OFFSET = 0xD00000
+
+# The only strings in a door's yml representation are the names of its enum values and its text pointer, all of which
+# yml writes unquoted
+DOOR_ENUM_NAMES = frozenset(enum.tostring(value)
+                            for enum in (DoorType, StairDirection, ClimbableType, DestinationDirection)
+                            for value in vars(enum).values() if isinstance(value, int))
+TEXT_POINTER_REGEX = re.compile(r"^\$[0-9a-f]+$")
+
+
+def sort_yml_doors(arg):
+    # The door file is always a mapping of rows to mappings of door areas, so only those two levels need to be sorted.
+    # The doors themselves are only ever accessed by key.
+    return {y: {x: row[x] for x in sorted(row)} for y, row in sorted(arg.items())}
+
+
+def door_yml_value(key, value):
+    if value is None:
+        return "null"
+    elif isinstance(value, int) and not isinstance(value, bool):
+        if key == "Event Flag" and value >= 0:
+            return "{:#x}".format(value)
+        return str(value)
+    elif isinstance(value, str) and (value in DOOR_ENUM_NAMES or TEXT_POINTER_REGEX.match(value)):
+        return value
+    else:
+        raise InvalidArgumentError("Cannot write door value[%r] for key[%s]" % (value, key))
+
 
-def sort_yml_doors(arg): # Reorder dicts
-    if isinstance(arg, list):
-        return [sort_yml_doors(v) for v in arg]
+def write_doors_yml(rows, f):
+    """Writes rows of door areas to f in the same format as yml_dump(default_flow_style=False) would, with the event
+    flags written in hexadecimal, but without building and post-processing a yml string of the whole file."""
+    if not rows:
+        f.write("{}\n")
+        return
 
-    if isinstance(arg, dict):
-        return OrderedDict((k, sort_yml_doors(arg[k])) for k in sorted(arg.keys()))
+    lines = []
+    for y, row in enumerate(rows):
+        if not row:
+            lines.append("{}: {{}}".format(y))
+            continue
+
+        lines.append("{}:".format(y))
+        for x, area in enumerate(row):
+            if area is None:
+                lines.append("  {}: null".format(x))
+                continue
+            elif not area:
+                lines.append("  {}: []".format(x))
+                continue
+
+            lines.append("  {}:".format(x))
+            for door in area:
+                prefix = "  - "
+                for key in sorted(door):
+                    lines.append("{}{}: {}".format(prefix, key, door_yml_value(key, door[key])))
+                    prefix = "    "
+    lines.append("")
+    f.write("\n".join(lines))
 
-    return arg
 
 class DoorModule(EbModule):
     NAME = "Doors"
 
     def __init__(self):
         super(EbModule, self).__init__()
-        self.pointer_table = eb_table_from_offset(0xD00000)
+        self.pointer_table = eb_table_from_offset(DOOR_POINTER_TABLE_OFFSET)
         self.door_areas = []
 
     def read_from_rom(self, rom):
-        self.pointer_table.from_block(rom, from_snes_address(0xD00000))
+        self.pointer_table.from_block(rom, from_snes_address(DOOR_POINTER_TABLE_OFFSET))
         self.door_areas = []
         for i in range(self.pointer_table.num_rows):
             offset = from_snes_address(self.pointer_table[i][0])
@@ -42,29 +98,15 @@ class DoorModule(EbModule):
             self.door_areas.append(door_area)
 
     def write_to_project(self, resourceOpener):
-        out = dict()
-        x = y = 0
-        rowOut = dict()
-        for entry in self.door_areas:
-            if not entry:
-                rowOut[x % 32] = None
-            else:
-                rowOut[x % 32] = [z.yml_rep() for z in entry]
-            if (x % 32) == 31:
-                # Start new row
-                out[y] = rowOut
-                x = 0
-                y += 1
-                rowOut = dict()
-            else:
-                x += 1
+        # Only complete rows of 32 door areas are written
+        rows = [[None] * 32 for _ in range(len(self.door_areas) // 32)]
+        for i, entry in enumerate(self.door_areas[:len(rows) * 32]):
+            if entry:
+                y, x = divmod(i, 32)
+                rows[y][x] = [z.yml_rep() for z in entry]
 
         with resourceOpener("map_doors", "yml", True) as f:
-            s = yml_dump(
-                out,
-                default_flow_style=False)
-            s = convert_values_to_hex_repr(yml_str_rep=s, key="Event Flag")
-            f.write(s)
+            write_doors_yml(rows, f)
 
     def read_from_project(self, resourceOpener):
         self.door_areas = []
@@ -90,18 +132,50 @@ class DoorModule(EbModule):
         rom.deallocate((0x0F0000, 0x0F58EE))
         destination_offsets = dict()
         empty_area_offset = from_snes_address(rom.allocate(data=[0, 0], can_write_to=not_in_destination_bank))
-        i = 0
-        for door_area in self.door_areas:
+
+        # Try to allocate space for all of the non-empty door areas at once, rather than searching for free space per
+        # area. Since allocation is first-fit, this takes the first free range which can hold every area, which may be
+        # a larger range than the per-area allocations would have used. If no single free range is big enough, such as
+        # in a fragmented ROM, allocate each area separately.
+        door_areas_size = sum(2 + len(door_area) * 5 for door_area in self.door_areas if door_area)
+        area_offset = None
+        if door_areas_size > 0:
+            try:
+                # Neither end of the range may be in the destination bank
+                area_offset = rom.allocate(size=door_areas_size,
+                                           can_write_to=lambda x: (not_in_destination_bank(x) and
+                                                                   not_in_destination_bank(x + door_areas_size - 1)))
+            except NotEnoughUnallocatedSpaceError:
+                pass
+
+        for i, door_area in enumerate(self.door_areas):
             if (door_area is None) or (not door_area):
                 self.pointer_table[i] = [empty_area_offset]
             else:
                 num_doors = len(door_area)
-                area_offset = rom.allocate(size=(2 + num_doors * 5), can_write_to=not_in_destination_bank)
-                self.pointer_table[i] = [to_snes_address(area_offset)]
-                rom.write_multi(area_offset, num_doors, 2)
-                area_offset += 2
+                if area_offset is None:
+                    offset = rom.allocate(size=(2 + num_doors * 5), can_write_to=not_in_destination_bank)
+                else:
+                    offset = area_offset
+                    area_offset += 2 + num_doors * 5
+                self.pointer_table[i] = [to_snes_address(offset)]
+                rom.write_multi(offset, num_doors, 2)
+                offset += 2
                 for door in door_area:
-                    door.write_to_block(rom, area_offset, destination_offsets)
-                    area_offset += 5
-            i += 1
-        self.pointer_table.to_block(rom, from_snes_address(0xD00000))
+                    door.write_to_block(rom, offset, destination_offsets)
+                    offset += 5
+
+        offset = from_snes_address(DOOR_POINTER_TABLE_OFFSET)
+        if self.pointer_table.size != 4 * self.pointer_table.num_rows:
+            # The table isn't a plain list of four-byte pointers, so let it write itself
+            self.pointer_table.to_block(rom, offset)
+        else:
+            # Every row of the pointer table is a single four-byte pointer, so pack the whole table at once
+            pointers = [row[0] for row in self.pointer_table.values]
+            try:
+                data = struct.pack("<{}I".format(len(pointers)), *pointers)
+            except struct.error as e:
+                entry = next((i for i, pointer in enumerate(pointers)
+                              if not (isinstance(pointer, int) and 0 <= pointer <= 0xffffffff)), None)
+                raise TableError(table_name=self.pointer_table.name, entry=entry, cause=e)
+            rom[offset:offset + self.pointer_table.size] = array.array('B', data)
@@ -49,7 +49,7 @@ class ExpandedTablesModule(EbModule):
         for offset, table in self.tables.items():
             new_table_offset = rom.allocate(size=table.size)
             table.to_block(rom, new_table_offset)
-            log.info("Writing table @ " + hex(to_snes_address(new_table_offset)))
+            log.info("Writing table @ %#x", to_snes_address(new_table_offset))
             for pointer in self.TABLE_OFFSETS[offset]:
                 pointer.write(rom, to_snes_address(new_table_offset))
 
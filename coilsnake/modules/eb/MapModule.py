@@ -1,16 +1,19 @@
-import yaml
+import array
+import sys
 
 from coilsnake.model.common.table import EnumeratedLittleEndianIntegerTableEntry, LittleEndianIntegerTableEntry, \
     RowTableEntry
 from coilsnake.model.eb.table import eb_table_from_offset
 from coilsnake.modules.eb.EbModule import EbModule
-from coilsnake.util.common.yml import replace_field_in_yml, yml_load
+from coilsnake.util.common.yml import replace_field_in_yml, yml_load, yml_dump
 from coilsnake.util.eb.pointer import from_snes_address
 
 MAP_POINTERS_OFFSET = 0xa1db
 LOCAL_TILESETS_OFFSET = 0x175000
 MAP_HEIGHT = 320
 MAP_WIDTH = 256
+# Every eighth row of the map is stored contiguously in one of eight chunks
+MAP_CHUNK_SIZE = (MAP_HEIGHT >> 3) * MAP_WIDTH
 
 SECTOR_TILESETS_PALETTES_TABLE_OFFSET = 0xD7A800
 SECTOR_MUSIC_TABLE_OFFSET = 0xDCD637
@@ -56,6 +59,38 @@ SectorYmlTable = RowTableEntry.from_schema(
 )
 
 
+# The two high bits of each tile are packed four rows to a byte. These tables extract the bits for each of those rows
+# when passed to bytes.translate().
+TILE_HIGH_BITS_TABLES = [bytes((x >> shift) & 3 for x in range(0x100)) for shift in (0, 2, 4, 6)]
+
+
+def tile_row_from_bytes(low_bytes, high_bytes):
+    data = bytearray(len(low_bytes) * 2)
+    data[0::2] = low_bytes
+    data[1::2] = high_bytes
+    row = array.array('H', data)
+    if sys.byteorder != "little":
+        row.byteswap()
+    return row
+
+
+def tile_rows_to_bytes(rows):
+    """Returns the tiles in rows as little-endian 16-bit values, so that the low and high bytes of the tiles can be
+    sliced out with [0::2] and [1::2]."""
+    data = array.array('H')
+    for row in rows:
+        data.extend(row)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def pack_tile_high_bits(rows):
+    """Packs the high bits of the tiles in four rows into one byte per column, in the format which
+    TILE_HIGH_BITS_TABLES unpacks."""
+    return [(a >> 8) | ((b >> 8) << 2) | ((c >> 8) << 4) | ((d >> 8) << 6) for a, b, c, d in zip(*rows)]
+
+
 class MapModule(EbModule):
     NAME = "Map"
 
@@ -80,23 +115,16 @@ class MapModule(EbModule):
         map_ptrs_addr = from_snes_address(rom.read_multi(MAP_POINTERS_OFFSET, 3))
         map_addrs = [from_snes_address(rom.read_multi(map_ptrs_addr + x * 4, 4)) for x in range(8)]
 
-        def read_row_data(row_number):
-            offset = map_addrs[row_number % 8] + ((row_number >> 3) << 8)
-            return rom[offset:offset + MAP_WIDTH].to_list()
+        chunks = [rom.read_bytes(map_addr, MAP_CHUNK_SIZE) for map_addr in map_addrs]
+        high_bits_data = rom.read_bytes(LOCAL_TILESETS_OFFSET, 0x3000 + MAP_CHUNK_SIZE)
 
-        self.tiles = list(map(read_row_data, range(MAP_HEIGHT)))
-        k = LOCAL_TILESETS_OFFSET
+        self.tiles = [None] * MAP_HEIGHT
         for i in range(MAP_HEIGHT >> 3):
-            for j in range(MAP_WIDTH):
-                self.tiles[i << 3][j] |= (rom[k] & 3) << 8
-                self.tiles[(i << 3) | 1][j] |= ((rom[k] >> 2) & 3) << 8
-                self.tiles[(i << 3) | 2][j] |= ((rom[k] >> 4) & 3) << 8
-                self.tiles[(i << 3) | 3][j] |= ((rom[k] >> 6) & 3) << 8
-                self.tiles[(i << 3) | 4][j] |= (rom[k + 0x3000] & 3) << 8
-                self.tiles[(i << 3) | 5][j] |= ((rom[k + 0x3000] >> 2) & 3) << 8
-                self.tiles[(i << 3) | 6][j] |= ((rom[k + 0x3000] >> 4) & 3) << 8
-                self.tiles[(i << 3) | 7][j] |= ((rom[k + 0x3000] >> 6) & 3) << 8
-                k += 1
+            k = i * MAP_WIDTH
+            packed_rows = (high_bits_data[k:k + MAP_WIDTH], high_bits_data[k + 0x3000:k + 0x3000 + MAP_WIDTH])
+            for j in range(8):
+                high_bits = packed_rows[j >> 2].translate(TILE_HIGH_BITS_TABLES[j & 3])
+                self.tiles[(i << 3) | j] = tile_row_from_bytes(chunks[j][k:k + MAP_WIDTH], high_bits)
 
         # Read sector data
         self.sector_tilesets_palettes_table.from_block(rom, from_snes_address(SECTOR_TILESETS_PALETTES_TABLE_OFFSET))
@@ -109,23 +137,19 @@ class MapModule(EbModule):
         map_ptrs_addr = from_snes_address(rom.read_multi(MAP_POINTERS_OFFSET, 3))
         map_addrs = [from_snes_address(rom.read_multi(map_ptrs_addr + x * 4, 4)) for x in range(8)]
 
-        for i in range(MAP_HEIGHT):
-            offset = map_addrs[i % 8] + ((i >> 3) << 8)
-            rom[offset:offset + MAP_WIDTH] = [x & 0xff for x in self.tiles[i]]
-        k = LOCAL_TILESETS_OFFSET
+        for i, map_addr in enumerate(map_addrs):
+            rom[map_addr:map_addr + MAP_CHUNK_SIZE] = array.array('B', tile_rows_to_bytes(self.tiles[i::8])[0::2])
+
+        # Collect each of the two areas of high bits in one buffer so that each can be written with a single write
+        upper_high_bits = array.array('B')
+        lower_high_bits = array.array('B')
         for i in range(MAP_HEIGHT >> 3):
-            for j in range(MAP_WIDTH):
-                c = ((self.tiles[i << 3][j] >> 8)
-                     | ((self.tiles[(i << 3) | 1][j] >> 8) << 2)
-                     | ((self.tiles[(i << 3) | 2][j] >> 8) << 4)
-                     | ((self.tiles[(i << 3) | 3][j] >> 8) << 6))
-                rom[k] = c
-                c = ((self.tiles[(i << 3) | 4][j] >> 8)
-                     | ((self.tiles[(i << 3) | 5][j] >> 8) << 2)
-                     | ((self.tiles[(i << 3) | 6][j] >> 8) << 4)
-                     | ((self.tiles[(i << 3) | 7][j] >> 8) << 6))
-                rom[k + 0x3000] = c
-                k += 1
+            rows = self.tiles[i << 3:(i + 1) << 3]
+            upper_high_bits.extend(pack_tile_high_bits(rows[:4]))
+            lower_high_bits.extend(pack_tile_high_bits(rows[4:]))
+        k = LOCAL_TILESETS_OFFSET
+        rom[k:k + MAP_CHUNK_SIZE] = upper_high_bits
+        rom[k + 0x3000:k + 0x3000 + MAP_CHUNK_SIZE] = lower_high_bits
 
         # Write sector data
         self.sector_tilesets_palettes_table.to_block(rom, from_snes_address(SECTOR_TILESETS_PALETTES_TABLE_OFFSET))
@@ -137,72 +161,53 @@ class MapModule(EbModule):
         # Write map tiles
         with resource_open("map_tiles", "map", True) as f:
             for row in self.tiles:
-                f.write(hex(row[0])[2:].zfill(3))
-                for tile in row[1:]:
-                    f.write(" ")
-                    f.write(hex(tile)[2:].zfill(3))
+                f.write(" ".join(map("{:03x}".format, row)))
                 f.write("\n")
 
-        for i in range(self.sector_yml_table.num_rows):
-            tileset = self.sector_tilesets_palettes_table[i][0] >> 3
-            palette = self.sector_tilesets_palettes_table[i][0] & 7
-            music = self.sector_music_table[i][0]
-            teleport = self.sector_misc_table[i][0] >> 7
-            townmap = (self.sector_misc_table[i][0] >> 3) & 7
-            setting = self.sector_misc_table[i][0] & 7
-            item = self.sector_misc_table[i][1]
-            townmap_arrow = self.sector_town_map_table[i][0] >> 4
-            townmap_image = self.sector_town_map_table[i][0] & 0xf
-            townmap_x = self.sector_town_map_table[i][1]
-            townmap_y = self.sector_town_map_table[i][2]
-
-            self.sector_yml_table[i] = [
-                tileset,
-                palette,
-                music,
-                teleport,
-                townmap,
-                setting,
-                item,
-                townmap_arrow,
-                townmap_image,
-                townmap_x,
-                townmap_y
-            ]
+        # Decode the sector tables a whole column of rows at a time, rather than going through each table's accessors
+        self.sector_yml_table.values = [
+            [tileset_palette >> 3,  # Tileset
+             tileset_palette & 7,  # Palette
+             music,
+             misc >> 7,  # Teleport
+             (misc >> 3) & 7,  # Town Map
+             misc & 7,  # Setting
+             item,
+             town_map >> 4,  # Town Map Arrow
+             town_map & 0xf,  # Town Map Image
+             townmap_x,
+             townmap_y]
+            for (tileset_palette,), (music,), (misc, item), (town_map, townmap_x, townmap_y)
+            in zip(self.sector_tilesets_palettes_table.values,
+                   self.sector_music_table.values,
+                   self.sector_misc_table.values,
+                   self.sector_town_map_table.values)
+        ]
+
         with resource_open("map_sectors", "yml", True) as f:
             self.sector_yml_table.to_yml_file(f)
 
     def read_from_project(self, resource_open):
         # Read map data
         with resource_open("map_tiles", "map", True) as f:
-            self.tiles = [[int(x, 16) for x in y.split(" ")] for y in f.readlines()]
+            self.tiles = [array.array('H', [int(x, 16) for x in line.split(" ")]) for line in f]
 
         # Read sector data
         with resource_open("map_sectors", "yml", True) as f:
             self.sector_yml_table.from_yml_file(f)
 
-        for i in range(self.sector_yml_table.num_rows):
-            tileset = self.sector_yml_table[i][0]
-            palette = self.sector_yml_table[i][1]
-            music = self.sector_yml_table[i][2]
-            teleport = self.sector_yml_table[i][3]
-            townmap = self.sector_yml_table[i][4]
-            setting = self.sector_yml_table[i][5]
-            item = self.sector_yml_table[i][6]
-            townmap_arrow = self.sector_yml_table[i][7]
-            townmap_image = self.sector_yml_table[i][8]
-            townmap_x = self.sector_yml_table[i][9]
-            townmap_y = self.sector_yml_table[i][10]
-
-            self.sector_tilesets_palettes_table[i] = [(tileset << 3) | palette]
-
-            self.sector_music_table[i] = [music]
-
-            self.sector_misc_table[i] = [(teleport << 7) | (townmap << 3) | setting, item]
+        tilesets_palettes, music_rows, misc_rows, town_map_rows = [], [], [], []
+        for (tileset, palette, music, teleport, townmap, setting, item, townmap_arrow, townmap_image, townmap_x,
+             townmap_y) in self.sector_yml_table.values:
+            tilesets_palettes.append([(tileset << 3) | palette])
+            music_rows.append([music])
+            misc_rows.append([(teleport << 7) | (townmap << 3) | setting, item])
+            town_map_rows.append([(townmap_arrow << 4) | (townmap_image & 0xf), townmap_x, townmap_y])
 
-            self.sector_town_map_table[i] = [((townmap_arrow << 4) | (townmap_image & 0xf)),
-                                             townmap_x,
-                                             townmap_y]
+        self.sector_tilesets_palettes_table.values = tilesets_palettes
+        self.sector_music_table.values = music_rows
+        self.sector_misc_table.values = misc_rows
+        self.sector_town_map_table.values = town_map_rows
 
     def upgrade_project(self, old_version, new_version, rom, resource_open_r, resource_open_w, resource_delete):
         if old_version == new_version:
@@ -219,12 +224,13 @@ class MapModule(EbModule):
             with resource_open_r("map_sectors", 'yml', True) as f:
                 data = yml_load(f)
                 for i in data:
-                    data[i]["Town Map Image"] = TOWNMAP_IMAGE_ENTRY.to_yml_rep(self.sector_town_map_table[i][0] & 0xf)
-                    data[i]["Town Map Arrow"] = TOWNMAP_ARROW_ENTRY.to_yml_rep(self.sector_town_map_table[i][0] >> 4)
-                    data[i]["Town Map X"] = TOWNMAP_X.to_yml_rep(self.sector_town_map_table[i][1])
-                    data[i]["Town Map Y"] = TOWNMAP_Y.to_yml_rep(self.sector_town_map_table[i][2])
+                    town_map, townmap_x, townmap_y = self.sector_town_map_table[i]
+                    data[i]["Town Map Image"] = TOWNMAP_IMAGE_ENTRY.to_yml_rep(town_map & 0xf)
+                    data[i]["Town Map Arrow"] = TOWNMAP_ARROW_ENTRY.to_yml_rep(town_map >> 4)
+                    data[i]["Town Map X"] = TOWNMAP_X.to_yml_rep(townmap_x)
+                    data[i]["Town Map Y"] = TOWNMAP_Y.to_yml_rep(townmap_y)
             with resource_open_w("map_sectors", 'yml', True) as f:
-                yaml.dump(data, f, Dumper=yaml.CSafeDumper, default_flow_style=False)
+                yml_dump(data, f, default_flow_style=False)
 
             self.upgrade_project(3, new_version, rom, resource_open_r, resource_open_w, resource_delete)
         else:
@@ -2,7 +2,7 @@ import logging
 
 from coilsnake.model.eb.table import eb_table_from_offset
 from coilsnake.modules.eb.EbModule import EbModule
-from coilsnake.util.common.yml import convert_values_to_hex_repr, replace_field_in_yml, yml_load, yml_dump
+from coilsnake.util.common.yml import convert_values_to_hex_ints, replace_field_in_yml, yml_load, yml_dump
 from coilsnake.util.eb.pointer import from_snes_address
 
 log = logging.getLogger(__name__)
@@ -116,13 +116,10 @@ class MiscTablesModule(EbModule):
                                  new_key="Delivery Failure Text Pointer")
 
             with resource_open_r("timed_delivery_table", "yml", True) as f:
-                out = yml_load(f)
-                yml_str_rep = yml_dump(out, default_flow_style=False)
-
-            yml_str_rep = convert_values_to_hex_repr(yml_str_rep, "Event Flag")
+                out = convert_values_to_hex_ints(yml_load(f), ["Event Flag"])
 
             with resource_open_w("timed_delivery_table", "yml", True) as f:
-                f.write(yml_str_rep)
+                yml_dump(out, f, default_flow_style=False)
 
             self.upgrade_project(old_version=old_version + 1,
                                  new_version=new_version,
@@ -7,7 +7,7 @@ from coilsnake.model.common.blocks import Block
 from coilsnake.model.eb.map_tilesets import EbMapPalette, EbTileset
 from coilsnake.model.eb.table import eb_table_from_offset
 from coilsnake.modules.eb.EbModule import EbModule
-from coilsnake.util.common.yml import convert_values_to_hex_repr, yml_load, yml_dump
+from coilsnake.util.common.yml import convert_values_to_hex_ints, yml_load, yml_dump
 from coilsnake.util.eb.helper import is_in_bank, not_in_bank
 from coilsnake.util.eb.pointer import from_snes_address, to_snes_address
 
@@ -156,9 +156,7 @@ class TilesetModule(EbModule):
 
     def write_map_palette_settings(self, palette_settings, resource_open):
         with resource_open("map_palette_settings", "yml", True) as f:
-            yml_str_rep = yml_dump(palette_settings, default_flow_style=False)
-            yml_str_rep = convert_values_to_hex_repr(yml_str_rep, "Event Flag")
-            f.write(yml_str_rep)
+            yml_dump(convert_values_to_hex_ints(palette_settings, ["Event Flag"]), f, default_flow_style=False)
 
     def write_to_project(self, resource_open):
         # Dump an additional YML with color0 data
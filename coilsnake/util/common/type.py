@@ -20,6 +20,15 @@ class StringRepresentationMixin(object):
 
 
 class GenericEnum(object):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Map each value to the name which tostring would have found first when scanning the class's attributes
+        value_names = {}
+        for k, v in vars(cls).items():
+            if isinstance(v, int):
+                value_names.setdefault(v, k.lower())
+        cls._value_names = value_names
+
     @staticmethod
     def create(name, values):
         return type("{}_GenericEnum".format(name),
@@ -35,9 +44,10 @@ class GenericEnum(object):
 
     @classmethod
     def tostring(cls, val):
-        for k, v in vars(cls).items():
-            if v == val:
-                return k.lower()
+        try:
+            return cls._value_names[val]
+        except (KeyError, TypeError):
+            pass
         from coilsnake.exceptions.common.exceptions import InvalidArgumentError
 
         raise InvalidArgumentError("Could not convert value[%s] to string because the value was undefined"
@@ -1,11 +1,17 @@
 import logging
 import os
-import re
 import traceback
 
 import yaml
 from yaml.scanner import ScannerError
 
+try:
+    # The pure-Python loader and dumper are far too slow for CoilSnake's larger resources, so require libyaml
+    from yaml import CSafeDumper, CSafeLoader
+except ImportError:
+    raise ImportError("Could not load the libyaml bindings for PyYAML, which CoilSnake requires. "
+                      "Please reinstall PyYAML with libyaml support.")
+
 from coilsnake.exceptions.common.exceptions import CoilSnakeUnexpectedError, InvalidYmlFileError
 from coilsnake.util.common.helper import lower_if_str
 
@@ -13,11 +19,30 @@ from coilsnake.util.common.helper import lower_if_str
 log = logging.getLogger(__name__)
 
 
-def convert_values_to_hex_repr(yml_str_rep, key):
-    return re.sub("{}: (\d+)".format(re.escape(key)),
-                  lambda i: "{}: {:#x}".format(key,
-                                               int(i.group(0)[i.group(0).find(": ") + 2:])),
-                  yml_str_rep)
+class HexInt(int):
+    """An int which yml_dump writes in hexadecimal."""
+
+
+class YmlDumper(CSafeDumper):
+    pass
+
+
+YmlDumper.add_representer(HexInt,
+                          lambda dumper, data: dumper.represent_scalar("tag:yaml.org,2002:int", "{:#x}".format(data)))
+
+
+def convert_values_to_hex_ints(yml_rep, keys):
+    """Returns a copy of a yml representation in which all non-negative integer values of the given keys, at any depth,
+    are HexInts, so that they are written in hexadecimal when dumped.
+    :param yml_rep: yml representation to convert
+    :param keys: keys whose values should be written in hexadecimal"""
+    if isinstance(yml_rep, dict):
+        return {k: HexInt(v) if (k in keys and type(v) is int and v >= 0) else convert_values_to_hex_ints(v, keys)
+                for k, v in yml_rep.items()}
+    elif isinstance(yml_rep, list):
+        return [convert_values_to_hex_ints(v, keys) for v in yml_rep]
+    else:
+        return yml_rep
 
 
 def replace_field_in_yml(resource_name, resource_open_r, resource_open_w, key, new_key=None, value_map=None):
@@ -51,19 +76,15 @@ def replace_field_in_yml(resource_name, resource_open_r, resource_open_w, key, n
 def convert_values_to_hex_repr_in_yml_file(resource_name, resource_open_r, resource_open_w, keys,
                                            default_flow_style=False):
     with resource_open_r(resource_name, "yml", True) as f:
-        out = yaml.load(f, Loader=yaml.CSafeLoader)
-        yml_str_rep = yaml.dump(out, default_flow_style=default_flow_style, Dumper=yaml.CSafeDumper)
-
-    for key in keys:
-        yml_str_rep = convert_values_to_hex_repr(yml_str_rep, key)
+        out = convert_values_to_hex_ints(yml_load(f), keys)
 
     with resource_open_w(resource_name, "yml", True) as f:
-        f.write(yml_str_rep)
+        yml_dump(out, f, default_flow_style=default_flow_style)
 
 
 def yml_load(f):
     try:
-        return yaml.load(f, Loader=yaml.CSafeLoader)
+        return yaml.load(f, Loader=CSafeLoader)
     except ScannerError as se:
         raise InvalidYmlFileError(
             "File {} is not syntactically valid YML. Error on line {}, column {} of the YML file: {}".format(
@@ -81,13 +102,13 @@ def yml_dump(yml_rep, f=None, default_flow_style=None):
             yaml.dump(yml_rep,
                       f,
                       default_flow_style=default_flow_style,
-                      Dumper=yaml.CSafeDumper)
+                      Dumper=YmlDumper)
         except:
             raise CoilSnakeUnexpectedError(traceback.format_exc())
     else:
         try:
             return yaml.dump(yml_rep,
                              default_flow_style=default_flow_style,
-                             Dumper=yaml.CSafeDumper)
+                             Dumper=YmlDumper)
         except:
-            raise CoilSnakeUnexpectedError(traceback.format_exc())
\ No newline at end of file
+            raise CoilSnakeUnexpectedError(traceback.format_exc())
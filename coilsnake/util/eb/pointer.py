@@ -1,8 +1,16 @@
 import logging
-from coilsnake.exceptions.common.exceptions import InvalidArgumentError
+import struct
+
+from coilsnake.exceptions.common.exceptions import InvalidArgumentError, OutOfBoundsError
 
 log = logging.getLogger(__name__)
 
+# An asm pointer is split across the 16-bit operands of two consecutive instructions, such as "LDA #$xxxx; STA $xx;
+# LDA #$xxxx", so its low half is at offset+1 and its high half is at offset+6
+ASM_POINTER_STRUCT = struct.Struct("<xHxxxH")
+# Writing the halves separately leaves the instructions' opcodes untouched
+ASM_POINTER_HALF_STRUCT = struct.Struct("<H")
+
 
 def from_snes_address(address):
     if address < 0:
@@ -20,35 +28,75 @@ def to_snes_address(address):
         return address + 0xc00000
 
 
+def pointer_data(block, offset, size):
+    """Returns the data to access a pointer of size bytes at offset in, after checking that the pointer is in bounds.
+    :param block: a Block, or a raw buffer such as bytes, a bytearray, a memoryview, or an array"""
+    to_array = getattr(block, "to_array", None)
+    data = block if to_array is None else to_array()
+    if (offset < 0) or (offset + size > len(data)):
+        raise OutOfBoundsError("Attempted to access pointer at offset[%#x] which is out of bounds" % offset)
+    return data
+
+
 def read_asm_pointer(block, offset):
-    part1 = block[offset + 1] | (block[offset + 2] << 8)
-    part2 = block[offset + 6] | (block[offset + 7] << 8)
+    data = pointer_data(block, offset, ASM_POINTER_STRUCT.size)
+    try:
+        part1, part2 = ASM_POINTER_STRUCT.unpack_from(data, offset)
+    except TypeError:
+        # Not a buffer, so fall back to reading the individual bytes
+        part1 = data[offset + 1] | (data[offset + 2] << 8)
+        part2 = data[offset + 6] | (data[offset + 7] << 8)
     return part1 | (part2 << 16)
 
 
 def write_asm_pointer(block, offset, pointer):
-    block[offset + 1] = pointer & 0xff
-    block[offset + 2] = (pointer >> 8) & 0xff
-    block[offset + 6] = (pointer >> 16) & 0xff
-    block[offset + 7] = (pointer >> 24) & 0xff
+    write_asm_pointers(block, (offset,), pointer)
+
+
+def write_asm_pointers(block, offsets, pointer):
+    """Writes the same asm pointer at each of the offsets in block, splitting it into its halves only once."""
+    low, high = pointer & 0xffff, (pointer >> 16) & 0xffff
+    for offset in offsets:
+        data = pointer_data(block, offset, ASM_POINTER_STRUCT.size)
+        try:
+            ASM_POINTER_HALF_STRUCT.pack_into(data, offset + 1, low)
+            ASM_POINTER_HALF_STRUCT.pack_into(data, offset + 6, high)
+        except TypeError:
+            # Not a writable buffer, so fall back to writing the individual bytes
+            data[offset + 1] = low & 0xff
+            data[offset + 2] = low >> 8
+            data[offset + 6] = high & 0xff
+            data[offset + 7] = high >> 8
+
 
 def write_xl_pointer(block, offset, pointer):
-    block[offset + 1] = pointer & 0xff
-    block[offset + 2] = (pointer >> 8) & 0xff
-    block[offset + 3] = (pointer >> 16) & 0xff
+    # The 24-bit operand of the instruction at offset
+    data = pointer_data(block, offset, 4)
+    try:
+        memoryview(data)[offset + 1:offset + 4] = (pointer & 0xffffff).to_bytes(3, "little")
+    except TypeError:
+        # Not a writable buffer, so fall back to writing the individual bytes
+        data[offset + 1] = pointer & 0xff
+        data[offset + 2] = (pointer >> 8) & 0xff
+        data[offset + 3] = (pointer >> 16) & 0xff
+
 
 class AsmPointerReference(object):
+    __slots__ = ("offset",)
+
     def __init__(self, offset):
         self.offset = offset
 
     def write(self, rom, address):
-        log.info("Writing pointer at " + hex(self.offset))
+        log.info("Writing pointer at %#x", self.offset)
         write_asm_pointer(rom, self.offset, address)
 
 class XlPointerReference(object):
+    __slots__ = ("offset",)
+
     def __init__(self, offset):
         self.offset = offset
 
     def write(self, rom, address):
-        log.info("Writing xl pointer at " + hex(self.offset))
+        log.info("Writing xl pointer at %#x", self.offset)
         write_xl_pointer(rom, self.offset, address)
@@ -2,7 +2,17 @@ class CharacterSubstitutions(object):
     character_substitutions = dict()
 
 
+# Maps each byte of standard text to the code point of the character it represents, as a byte to be decoded as latin-1
+STANDARD_TEXT_DECODE_TABLE = bytes((c - 0x30) & 0xff for c in range(0x100))
+
+
 def standard_text_from_block(block, offset, max_length):
+    # Decode the text with bytes operations when it is entirely inside the block and only contains printable characters
+    if (offset >= 0) and (offset + max_length <= len(block)):
+        data = block.read_bytes(offset, max_length).partition(b"\0")[0]
+        if (not data) or (min(data) >= 0x30):
+            return data.translate(STANDARD_TEXT_DECODE_TABLE).decode("latin-1")
+
     str = ''
     for i in range(offset, offset + max_length):
         c = block[i]
@@ -130,6 +130,20 @@ class TestBlock(BaseTestCase):
         assert_raises(OutOfBoundsError, self.block.read_multi, 5, 2)
         assert_raises(OutOfBoundsError, self.block.read_multi, 0, 7)
 
+    def test_read_bytes(self):
+        self.block.from_list([0x03, 0xa1, 0x44, 0x15, 0x92, 0x65])
+
+        assert_equal(self.block.read_bytes(0, 6), b"\x03\xa1\x44\x15\x92\x65")
+        assert_equal(self.block.read_bytes(1, 3), b"\xa1\x44\x15")
+        assert_equal(self.block.read_bytes(5, 1), b"\x65")
+        assert_equal(self.block.read_bytes(2, 0), b"")
+
+        assert_raises(InvalidArgumentError, self.block.read_bytes, 0, -1)
+        assert_raises(OutOfBoundsError, self.block.read_bytes, -1, 3)
+        assert_raises(OutOfBoundsError, self.block.read_bytes, 7, 1)
+        assert_raises(OutOfBoundsError, self.block.read_bytes, 5, 2)
+        assert_raises(OutOfBoundsError, self.block.read_bytes, 0, 7)
+
     def test_write_multi(self):
         self.block.from_list([0x03, 0xa1, 0x44, 0x15, 0x92, 0x65])
 
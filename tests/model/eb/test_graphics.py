@@ -551,6 +551,18 @@ class TestEbGraphicTileset(BaseTestCase, TilesetImageTestCase):
         tile2_id, tile2_vflip, tile2_hflip = tileset.add_tile(tile)
         assert_not_equal(tile2_id, tile1_id)
 
+    def test_hash(self):
+        tileset1 = EbGraphicTileset(num_tiles=2, tile_width=8, tile_height=8)
+        tileset2 = EbGraphicTileset(num_tiles=2, tile_width=8, tile_height=8)
+        tile = [array('B', [i] * 8) for i in range(8)]
+        tileset1.add_tile(tile)
+        tileset2.add_tile(tile)
+        assert_equal(tileset1.hash(), tileset2.hash())
+
+        tile[0][0] = 7
+        tileset2.add_tile(tile)
+        assert_not_equal(tileset1.hash(), tileset2.hash())
+
 
 class TestEbTileArrangementItem(BaseTestCase):
     def test_init(self):
@@ -674,6 +686,14 @@ class TestEbTileArrangement(BaseTestCase, TilesetImageTestCase):
         assert_raises(InvalidArgumentError, arrangement.__getitem__, (1, 2))
         assert_raises(InvalidArgumentError, arrangement.__getitem__, (3, 0))
 
+    def test_hash(self):
+        arrangement1 = EbTileArrangement(2, 1)
+        arrangement2 = EbTileArrangement(2, 1)
+        assert_equal(arrangement1.hash(), arrangement2.hash())
+
+        arrangement2[1, 0].is_horizontally_flipped = True
+        assert_not_equal(arrangement1.hash(), arrangement2.hash())
+
     def test_from_image_single_subpalette(self):
         palette = EbPalette(1, 2)
         tileset = EbGraphicTileset(num_tiles=6, tile_width=8, tile_height=8)
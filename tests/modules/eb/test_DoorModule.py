@@ -1,10 +1,15 @@
 import os
+from io import StringIO
 
-from nose.tools import assert_equal, assert_true, assert_dict_equal
+import mock
+from nose.tools import assert_equal, assert_true, assert_dict_equal, assert_raises
 from nose.tools.nontrivial import nottest
 
-from coilsnake.modules.eb.DoorModule import DoorModule
+from coilsnake.exceptions.common.exceptions import InvalidArgumentError, TableError
+from coilsnake.modules.eb.DoorModule import DoorModule, write_doors_yml
 from coilsnake.model.common.blocks import Rom
+from coilsnake.model.eb.doors import RopeOrLadderDoor
+from coilsnake.util.common.yml import convert_values_to_hex_ints, yml_dump, yml_load
 from tests.coilsnake_test import BaseTestCase, TemporaryWritableFileTestCase, TEST_DATA_DIR
 
 
@@ -108,4 +113,91 @@ class TestDoorModule(BaseTestCase, TemporaryWritableFileTestCase):
         with Rom() as rom:
             rom.from_file(os.path.join(TEST_DATA_DIR, 'roms', 'real_EarthBound.smc'))
             self.module.write_to_rom(rom)
-            self.test_read_from_rom_using_rom(rom)
\ No newline at end of file
+            self.test_read_from_rom_using_rom(rom)
+
+    def test_write_to_rom_fragmented(self):
+        # No single free range is big enough for all of the door areas, so each area must be allocated separately
+        self.module.door_areas = [[RopeOrLadderDoor(x=i & 0xff, y=i >> 8), RopeOrLadderDoor(x=1, y=2)] if i % 3 else []
+                                  for i in range(40 * 32)]
+
+        with Rom(size=0x300000) as rom:
+            for i in range(200):
+                rom.deallocate((0x200000 + i * 0x80, 0x20003f + i * 0x80))
+            rom.deallocate((0x280000, 0x280fff))
+            self.module.write_to_rom(rom)
+
+            door_areas = self.module.door_areas
+            self.module = DoorModule()
+            self.module.read_from_rom(rom)
+            assert_equal(self.module.door_areas, door_areas)
+
+    def test_write_to_rom_not_into_destination_bank(self):
+        # The first free range which is big enough for all of the door areas runs into the destination bank, so it must
+        # be skipped and left as it was
+        self.module.door_areas = [[RopeOrLadderDoor(x=1, y=2)] if i < 100 else [] for i in range(40 * 32)]
+
+        with Rom(size=0x300000) as rom:
+            rom.deallocate((0x0efe00, 0x0f03ff))
+            rom.deallocate((0x200000, 0x20ffff))
+            self.module.write_to_rom(rom)
+
+            assert_true((0x0efe02, 0x0f03ff) in rom.unallocated_ranges)
+            for i in range(100):
+                assert_equal(self.module.pointer_table[i][0] >> 16, 0xe0)
+
+    def test_write_to_rom_invalid_pointer(self):
+        self.module.door_areas = [[] for i in range(self.module.pointer_table.num_rows)]
+        self.module.door_areas[5] = [RopeOrLadderDoor(x=1, y=2)]
+
+        with Rom(size=0x300000) as rom:
+            rom.deallocate((0x200000, 0x20ffff))
+            # Give the only non-empty door area a pointer which can't be written
+            with mock.patch("coilsnake.modules.eb.DoorModule.to_snes_address", return_value=-1):
+                with assert_raises(TableError) as cm:
+                    self.module.write_to_rom(rom)
+            assert_equal(cm.exception.entry, 5)
+
+
+def door_rows_yml_rep(rows):
+    return {y: {x: area for x, area in enumerate(row)} for y, row in enumerate(rows)}
+
+
+def write_doors_yml_to_string(rows):
+    f = StringIO()
+    write_doors_yml(rows, f)
+    return f.getvalue()
+
+
+def test_write_doors_yml():
+    rows = [
+        [None,
+         [{"X": 1, "Y": 2, "Type": "switch", "Event Flag": 0x8123, "Text Pointer": "$c5e4f0"},
+          {"X": 3, "Y": 4, "Type": "rope"}],
+         [],
+         [{"X": 0, "Y": 0, "Type": "object", "Event Flag": 0, "Text Pointer": "$0"}]],
+        [],
+        [[{"X": 5, "Y": 6, "Type": "door", "Event Flag": 0x12, "Text Pointer": "$c7a0b1", "Destination X": 40,
+           "Destination Y": 17, "Direction": "down", "Style": 8}],
+         [{"X": 7, "Y": 8, "Type": "escalator", "Direction": "nowhere"}],
+         [{"X": 9, "Y": 10, "Type": "stairway", "Direction": "se"}],
+         [{"X": 11, "Y": 12, "Type": "ladder"}],
+         None]
+    ]
+
+    # Should match what dumping the whole file with yml_dump, with the event flags in hex, would produce
+    yml_str = write_doors_yml_to_string(rows)
+    assert_equal(yml_str, yml_dump(convert_values_to_hex_ints(door_rows_yml_rep(rows), ["Event Flag"]),
+                                   default_flow_style=False))
+    assert_equal(yml_load(yml_str), door_rows_yml_rep(rows))
+
+
+def test_write_doors_yml_empty():
+    assert_equal(write_doors_yml_to_string([]), "{}\n")
+    assert_equal(yml_load(write_doors_yml_to_string([])), {})
+
+
+def test_write_doors_yml_unsupported_value():
+    # Only enum names and text pointers can be written as strings
+    for value in ["yes", "null", "Down", "it's: a label", "line\nbreak", " $c5e4f0"]:
+        rows = [[[{"X": 1, "Y": 2, "Type": "object", "Text Pointer": value}]]]
+        assert_raises(InvalidArgumentError, write_doors_yml_to_string, rows)
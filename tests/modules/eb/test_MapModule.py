@@ -0,0 +1,26 @@
+import array
+
+from nose.tools import assert_equal, assert_list_equal
+
+from coilsnake.modules.eb.MapModule import TILE_HIGH_BITS_TABLES, pack_tile_high_bits, tile_row_from_bytes, \
+    tile_rows_to_bytes
+
+
+def test_tile_rows_round_trip():
+    # Each row has every possible value of the high bits, in a different order per row so that each of the four shift
+    # positions in a packed byte holds a different value
+    rows = [array.array('H', [(((x + y) & 3) << 8) | (0x10 * y + x) for x in range(4)]) for y in range(4)]
+
+    data = tile_rows_to_bytes(rows)
+    assert_equal(data, bytes([0x00, 0, 0x01, 1, 0x02, 2, 0x03, 3,
+                              0x10, 1, 0x11, 2, 0x12, 3, 0x13, 0,
+                              0x20, 2, 0x21, 3, 0x22, 0, 0x23, 1,
+                              0x30, 3, 0x31, 0, 0x32, 1, 0x33, 2]))
+
+    packed = bytes(pack_tile_high_bits(rows))
+    assert_equal(packed, bytes([0b11100100, 0b00111001, 0b01001110, 0b10010011]))
+
+    low_bytes = data[0::2]
+    for y in range(4):
+        high_bits = packed.translate(TILE_HIGH_BITS_TABLES[y])
+        assert_list_equal(tile_row_from_bytes(low_bytes[y * 4:(y + 1) * 4], high_bits).tolist(), rows[y].tolist())
@@ -2,7 +2,7 @@ import os
 
 from nose.tools import assert_equal
 
-from coilsnake.util.common.yml import replace_field_in_yml, convert_values_to_hex_repr
+from coilsnake.util.common.yml import replace_field_in_yml, convert_values_to_hex_ints, yml_dump
 from tests.coilsnake_test import BaseTestCase, TemporaryWritableFileTestCase, TEST_DATA_DIR, assert_files_equal
 
 
@@ -54,8 +54,11 @@ class TestReplaceFieldInYml(BaseTestCase, TemporaryWritableFileTestCase):
                     assert_files_equal(f1, f2)
 
 
-def test_convert_values_to_hex_repr():
-    assert_equal(convert_values_to_hex_repr("ABC: 0", "ABC"), "ABC: 0x0")
-    assert_equal(convert_values_to_hex_repr("ABC: 55", "ABC"), "ABC: 0x37")
-    assert_equal(convert_values_to_hex_repr("ABC: 55", "ABCD"), "ABC: 55")
-    assert_equal(convert_values_to_hex_repr("A:\n  - {ABC: 16}", "ABC"), "A:\n  - {ABC: 0x10}")
\ No newline at end of file
+def test_convert_values_to_hex_ints():
+    assert_equal(yml_dump(convert_values_to_hex_ints({"ABC": 0}, ["ABC"]), default_flow_style=False), "ABC: 0x0\n")
+    assert_equal(yml_dump(convert_values_to_hex_ints({"ABC": 55}, ["ABC"]), default_flow_style=False), "ABC: 0x37\n")
+    assert_equal(yml_dump(convert_values_to_hex_ints({"ABC": 55}, ["ABCD"]), default_flow_style=False), "ABC: 55\n")
+    assert_equal(yml_dump(convert_values_to_hex_ints({"ABC": -1}, ["ABC"]), default_flow_style=False), "ABC: -1\n")
+    assert_equal(yml_dump(convert_values_to_hex_ints({"ABC": True}, ["ABC"]), default_flow_style=False), "ABC: true\n")
+    assert_equal(yml_dump(convert_values_to_hex_ints({"A": [{"ABC": 16}]}, ["ABC"]), default_flow_style=None),
+                 "A:\n- {ABC: 0x10}\n")
@@ -1,9 +1,10 @@
 from nose.tools import assert_equal, assert_list_equal
 from nose.tools.nontrivial import raises
 
-from coilsnake.exceptions.common.exceptions import InvalidArgumentError
+from coilsnake.exceptions.common.exceptions import InvalidArgumentError, OutOfBoundsError
 from coilsnake.model.common.blocks import Block
-from coilsnake.util.eb.pointer import from_snes_address, write_asm_pointer, read_asm_pointer, to_snes_address
+from coilsnake.util.eb.pointer import from_snes_address, write_asm_pointer, read_asm_pointer, to_snes_address, \
+    write_asm_pointers, write_xl_pointer
 
 
 def test_from_snes_address():
@@ -37,8 +38,76 @@ def test_read_asm_pointer():
     assert_equal(read_asm_pointer(block, 1), 0x78563412)
 
 
+def test_read_asm_pointer_from_buffer():
+    data = [0xee, 0xee, 0x12, 0x34, 0xee, 0xee, 0xee, 0x56, 0x78]
+    assert_equal(read_asm_pointer(bytes(data), 1), 0x78563412)
+    assert_equal(read_asm_pointer(memoryview(bytearray(data)), 1), 0x78563412)
+    assert_equal(read_asm_pointer(data, 1), 0x78563412)
+
+
+@raises(OutOfBoundsError)
+def test_read_asm_pointer_out_of_bounds():
+    block = Block()
+    block.from_list([0xee] * 8)
+    read_asm_pointer(block, 1)
+
+
 def test_write_asm_pointer():
     block = Block()
     block.from_list([0xee] * 9)
     write_asm_pointer(block, 1, 0xabcdef12)
-    assert_list_equal(block.to_list(), [0xee, 0xee, 0x12, 0xef, 0xee, 0xee, 0xee, 0xcd, 0xab])
\ No newline at end of file
+    assert_list_equal(block.to_list(), [0xee, 0xee, 0x12, 0xef, 0xee, 0xee, 0xee, 0xcd, 0xab])
+
+
+def test_write_asm_pointer_to_buffer():
+    data = bytearray([0xee] * 9)
+    write_asm_pointer(data, 1, 0xabcdef12)
+    assert_list_equal(list(data), [0xee, 0xee, 0x12, 0xef, 0xee, 0xee, 0xee, 0xcd, 0xab])
+
+    data = [0xee] * 9
+    write_asm_pointer(data, 1, 0xabcdef12)
+    assert_list_equal(data, [0xee, 0xee, 0x12, 0xef, 0xee, 0xee, 0xee, 0xcd, 0xab])
+
+
+@raises(OutOfBoundsError)
+def test_write_asm_pointer_out_of_bounds():
+    block = Block()
+    block.from_list([0xee] * 8)
+    write_asm_pointer(block, 1, 0xabcdef12)
+
+
+def test_write_asm_pointers():
+    block = Block()
+    block.from_list([0xee] * 18)
+    write_asm_pointers(block, [1, 9], 0xabcdef12)
+    assert_list_equal(block.to_list(), [0xee, 0xee, 0x12, 0xef, 0xee, 0xee, 0xee, 0xcd, 0xab,
+                                        0xee, 0x12, 0xef, 0xee, 0xee, 0xee, 0xcd, 0xab, 0xee])
+
+
+@raises(OutOfBoundsError)
+def test_write_asm_pointers_out_of_bounds():
+    block = Block()
+    block.from_list([0xee] * 15)
+    write_asm_pointers(block, [0, 8], 0xabcdef12)
+
+
+def test_write_xl_pointer():
+    block = Block()
+    block.from_list([0xee] * 5)
+    write_xl_pointer(block, 1, 0xabcdef12)
+    assert_list_equal(block.to_list(), [0xee, 0xee, 0x12, 0xef, 0xcd])
+
+    data = bytearray([0xee] * 4)
+    write_xl_pointer(data, 0, 0xc01234)
+    assert_list_equal(list(data), [0xee, 0x34, 0x12, 0xc0])
+
+    data = [0xee] * 4
+    write_xl_pointer(data, 0, 0xc01234)
+    assert_list_equal(data, [0xee, 0x34, 0x12, 0xc0])
+
+
+@raises(OutOfBoundsError)
+def test_write_xl_pointer_out_of_bounds():
+    block = Block()
+    block.from_list([0xee] * 4)
+    write_xl_pointer(block, 1, 0xc01234)
@@ -1,11 +1,22 @@
 # coding: utf-8
-from nose.tools import assert_list_equal
+from nose.tools import assert_equal, assert_list_equal
 from nose.tools.nontrivial import raises
 
-from coilsnake.util.eb.text import standard_text_to_block, CharacterSubstitutions, standard_text_to_byte_list
+from coilsnake.util.eb.text import standard_text_from_block, standard_text_to_block, CharacterSubstitutions, \
+    standard_text_to_byte_list
 from coilsnake.model.common.blocks import Block
 
 
+def test_standard_text_from_block():
+    b = Block()
+    b.from_list([132, 149, 163, 164, 0, 0x66, 0x66])
+    assert_equal(standard_text_from_block(block=b, offset=0, max_length=7), "Test")
+    assert_equal(standard_text_from_block(block=b, offset=1, max_length=2), "es")
+    assert_equal(standard_text_from_block(block=b, offset=4, max_length=3), "")
+    # Text which isn't null-terminated may end at the end of the block
+    assert_equal(standard_text_from_block(block=b, offset=5, max_length=2), "66")
+
+
 def test_standard_text_to_block():
     b = Block()
 